@@ -0,0 +1,676 @@
+import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
+import subprocess
+import logging
+import os
+import sys
+import signal
+import threading
+import concurrent.futures
+import collections
+import random
+import shutil
+import importlib.metadata
+import importlib.util
+import functools
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, List
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson이 없으면 표준 json으로 대체
+    json_loads = json.loads
+
+# 의존성 확인 결과 캐시 (잦은 재시작 시 streamlink --version 실행 생략)
+DEPS_CACHE_FILE = Path.home() / '.cache' / 'chzzk_recorder' / 'deps.json'
+DEPS_CACHE_TTL = 24 * 60 * 60
+
+# API 요청 실패로 라이브 상태를 알 수 없을 때의 상태값 (방송 종료로 취급하지 않음)
+STATUS_UNKNOWN = 'UNKNOWN'
+
+# 예기치 않은 오류 발생 시 재시도 대기 (지수 백오프, 초)
+ERROR_BACKOFF_BASE = 2
+ERROR_BACKOFF_MAX = 30
+
+# 방송 중 녹화 프로세스가 바로 죽을 때의 재시작 한도와 대기 (지수 백오프, 초)
+RESTART_LIMIT = 10
+RESTART_BACKOFF_BASE = 5
+RESTART_BACKOFF_MAX = 300
+# 이 시간 이상 정상 녹화된 뒤 종료되면 재시작 횟수를 초기화
+RESTART_RESET_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=None)
+def load_environment():
+    """.env 파일 로딩 (프로세스당 한 번만 수행)"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+class ChzzkRecorder:
+    """치지직 자동 녹화기 메인 클래스"""
+    
+    def __init__(self):
+        """초기화"""
+        # 환경 변수 로딩
+        load_environment()
+        
+        # 로깅 설정
+        self._setup_logging()
+        
+        # 환경 변수 설정
+        self._load_environment_vars()
+        
+        # API 설정
+        self._setup_api()
+        
+        # 상태 변수
+        self.current_recording_process: Optional[subprocess.Popen] = None
+        self.current_title: Optional[str] = None
+        self.current_channel_name: Optional[str] = None
+        self.session_parts: List[str] = []
+        self.shutdown_flag: bool = False
+        self._stop_event = threading.Event()
+        self._child_died = threading.Event()
+        self.restart_count: int = 0
+        self._next_restart_at: float = 0.0
+        self._recording_started_at: float = 0.0
+        # 방송 종료 후 백그라운드에서 마무리 중인 녹화 프로세스
+        self._finishing_process: Optional[subprocess.Popen] = None
+        
+        # 모니터링 워커 재사용 (파일 병합 중에도 다음 녹화의 stderr를 바로 읽을 수 있도록 2개)
+        self._monitor_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='rec-mon')
+        self.last_status: Optional[str] = None
+        self.retry_count: int = 0
+        self.poll_interval: float = self.check_interval
+        self.offline_polls: int = 0
+        
+        # 파일명에서 특수문자 제거용 변환 테이블
+        self._sanitize_tbl = str.maketrans('', '', '\\/:*?"<>|')
+        
+        # 시그널 핸들러 등록
+        self._setup_signal_handlers()
+    
+    def _setup_logging(self):
+        """로깅 설정"""
+        self.logger = logging.getLogger('chzzk_recorder')
+        
+        # 이미 설정된 경우 FileHandler를 중복 생성하지 않음
+        if logging.getLogger().handlers:
+            return
+        
+        logging.basicConfig(
+            level=logging.INFO, 
+            format="[%(asctime)s] [%(levelname)s] %(message)s", 
+            datefmt="%Y-%m-%d %H:%M:%S",
+            handlers=[
+                logging.StreamHandler(),
+                logging.FileHandler('chzzk_recorder.log', encoding='utf-8')
+            ]
+        )
+    
+    def _load_environment_vars(self):
+        """환경 변수 로딩"""
+        self.channel_id = os.getenv('CHANNEL_ID')
+        self.nid_aut = os.getenv('NID_AUT')
+        self.nid_ses = os.getenv('NID_SES')
+        self.record_dir = os.getenv('RECORD_DIR', './recordings')
+        self.check_interval = int(os.getenv('CHECK_INTERVAL', '60'))
+        self.min_check_interval = int(os.getenv('MIN_CHECK_INTERVAL', '3'))
+        self.max_check_interval = int(os.getenv('MAX_CHECK_INTERVAL', '300'))
+        self.retry_count_max = int(os.getenv('RETRY_COUNT', '3'))
+        self.use_ws = os.getenv('USE_WS', '0') == '1'
+        self.ws_url = os.getenv('CHZZK_WS_URL', 'wss://pubsub.chzzk.naver.com/ws')
+        
+        # 실행 중에는 바뀌지 않는 Streamlink 명령어 앞부분
+        self._cmd_prefix = [
+            'streamlink',
+            '--ffmpeg-copyts',
+            '--progress', 'no',
+            '--retry-streams', '3',
+            '--retry-open', '3',
+            f'https://chzzk.naver.com/live/{self.channel_id}',
+            'best',
+            '--http-cookie', f'NID_AUT={self.nid_aut}',
+            '--http-cookie', f'NID_SES={self.nid_ses}',
+        ]
+    
+    def _setup_api(self):
+        """API 설정"""
+        self.chzzk_api = f'https://api.chzzk.naver.com/service/v3/channels/{self.channel_id}/live-detail'
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        }
+        
+        # 조건부 요청(ETag/Last-Modified) 캐시
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached_live_info: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
+        
+        # keep-alive 연결을 재사용해 매 폴링마다 TCP/TLS 핸드셰이크를 생략
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        ))
+    
+    def _setup_signal_handlers(self):
+        """시그널 핸들러 설정"""
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+    
+    def _signal_handler(self, signum, frame):
+        """시그널 핸들러 - 우아한 종료"""
+        self.logger.info("종료 신호를 받았습니다. 프로그램을 종료합니다...")
+        self.shutdown_flag = True
+        self._stop_event.set()
+        
+        if self.current_recording_process:
+            self.logger.info("진행 중인 녹화를 종료합니다...")
+            try:
+                self.current_recording_process.terminate()
+                self.current_recording_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.current_recording_process.kill()
+            except Exception as e:
+                self.logger.error(f"녹화 프로세스 종료 중 오류: {e}")
+        
+        self._monitor_pool.shutdown(wait=False, cancel_futures=True)
+        sys.exit(0)
+    
+    def _get_streamlink_version(self) -> Optional[str]:
+        """streamlink 버전 확인 (24시간 동안 디스크 캐시 사용)"""
+        try:
+            cache = json.loads(DEPS_CACHE_FILE.read_text(encoding='utf-8'))
+            if time.time() - cache['ts'] < DEPS_CACHE_TTL:
+                return cache['streamlink']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        streamlink_path = shutil.which('streamlink')
+        if streamlink_path is None:
+            return None
+        
+        # 같은 환경에 pip로 설치된 경우 인터프리터를 새로 띄우지 않고 메타데이터에서 확인
+        try:
+            version = f"streamlink {importlib.metadata.version('streamlink')}"
+        except importlib.metadata.PackageNotFoundError:
+            result = subprocess.run([streamlink_path, '--version'], 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode != 0:
+                return None
+            version = result.stdout.strip()
+        
+        try:
+            DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            DEPS_CACHE_FILE.write_text(json.dumps({'ts': time.time(), 'streamlink': version}), encoding='utf-8')
+        except OSError as e:
+            self.logger.warning(f"의존성 캐시 저장 실패: {e}")
+        return version
+    
+    def check_dependencies(self) -> bool:
+        """필수 의존성 확인"""
+        try:
+            # streamlink 설치 확인
+            version = self._get_streamlink_version()
+            if version:
+                self.logger.info(f"Streamlink 버전: {version}")
+            else:
+                self.logger.error("Streamlink가 설치되지 않았습니다.")
+                return False
+                
+            # 녹화 디렉토리 생성
+            Path(self.record_dir).mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"녹화 디렉토리: {self.record_dir}")
+            
+            # 환경 변수 확인
+            if not all([self.channel_id, self.nid_aut, self.nid_ses]):
+                self.logger.error("필수 환경 변수가 설정되지 않았습니다 (CHANNEL_ID, NID_AUT, NID_SES)")
+                return False
+                
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"의존성 확인 중 오류: {e}")
+            return False
+    
+    def get_live_info(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """라이브 상태 정보 가져오기"""
+        try:
+            # 변경이 없으면 304로 본문 없이 응답받아 직전 결과를 재사용
+            conditional_headers = {}
+            if self._etag:
+                conditional_headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                conditional_headers['If-Modified-Since'] = self._last_modified
+            
+            response = self.session.get(self.chzzk_api, headers=conditional_headers, timeout=10)
+            if response.status_code == 304 and self._cached_live_info is not None:
+                return self._cached_live_info
+            response.raise_for_status()
+            
+            data = json_loads(response.content)
+            live_info = self._parse_live_content(data.get('content'))
+            
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._cached_live_info = live_info
+            return live_info
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"API 요청 실패: {e}")
+            return STATUS_UNKNOWN, None, None
+        except Exception as e:
+            self.logger.error(f"라이브 정보 가져오기 실패: {e}")
+            return STATUS_UNKNOWN, None, None
+    
+    def _parse_live_content(self, content: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """live-detail 응답(또는 WebSocket 이벤트)의 content를 상태 튜플로 변환"""
+        if content is None:
+            self.logger.info("채널이 장기간 스트리밍하지 않았습니다.")
+            return None, None, None
+            
+        status = content.get('status')
+        title = content.get('liveTitle', 'Unknown Title')
+        channel_name = (content.get('channel') or {}).get('channelName', 'UnknownChannel')
+        
+        return status, title, channel_name
+    
+    def run_streamlink(self, title: str, channel_name: str) -> Optional[subprocess.Popen]:
+        """Streamlink를 사용하여 녹화 시작"""
+        try:
+            # 파일명 생성
+            cleaned_title = title.strip().translate(self._sanitize_tbl)
+            current_time = time.strftime('%Y%m%d-%H%M%S')
+            file_name = f"{current_time}_{channel_name}_{cleaned_title}"
+            # 재시작이 같은 초에 일어나도 파일명이 겹치지 않도록 두 번째 조각부터 번호 부여
+            if self.session_parts:
+                file_name += f"_part{len(self.session_parts) + 1}"
+            output_file = os.path.join(self.record_dir, f"{file_name}.mp4")
+            
+            self.logger.info(f"녹화 시작: {output_file}")
+            
+            # 네트워크 공유 재마운트 등으로 디렉토리가 사라졌을 수 있으므로 다시 보장
+            Path(self.record_dir).mkdir(parents=True, exist_ok=True)
+            
+            # Streamlink 명령어 구성
+            cmd = self._cmd_prefix + ['--output', output_file]
+            
+            self._child_died.clear()
+            
+            # 비동기로 Streamlink 실행 (stderr는 모니터링 워커가 한 줄씩 읽어 로그로 전달)
+            self.current_recording_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            
+            self._recording_started_at = time.monotonic()
+            if output_file not in self.session_parts:
+                self.session_parts.append(output_file)
+            self.logger.info(f"녹화 프로세스 시작됨 (PID: {self.current_recording_process.pid})")
+            
+            return self.current_recording_process
+            
+        except Exception as e:
+            self.logger.error(f"Streamlink 실행 중 오류: {e}")
+            self.current_recording_process = None
+            return None
+    
+    def monitor_recording(self, process: subprocess.Popen, title: str):
+        """녹화 프로세스 모니터링"""
+        try:
+            # 출력을 한 번에 모으지 않고 줄 단위로 전달, 실패 시 보여줄 마지막 줄만 보관
+            stderr_tail = collections.deque(maxlen=50)
+            for raw_line in process.stderr:
+                line = raw_line.decode('utf-8', errors='replace').rstrip()
+                if line:
+                    self.logger.debug(f"[streamlink] {line}")
+                    stderr_tail.append(line)
+            process.wait()
+            
+            if process.returncode == 0:
+                self.logger.info(f"녹화 완료: {title}")
+            else:
+                self.logger.error(f"녹화 실패 (종료 코드: {process.returncode})")
+                if stderr_tail:
+                    error_message = '\n'.join(stderr_tail)
+                    self.logger.error(f"오류 메시지: {error_message}")
+                    
+        except Exception as e:
+            self.logger.error(f"녹화 모니터링 중 오류: {e}")
+        finally:
+            # 메인 루프가 poll() 없이 종료를 알 수 있도록 알림 (현재 녹화일 때만)
+            if process is self.current_recording_process:
+                self._child_died.set()
+    
+    def _merge_session_parts(self, parts: List[str], process: Optional[subprocess.Popen] = None):
+        """방송 중 재시작으로 나뉜 녹화 파일을 ffmpeg concat으로 하나로 합치기"""
+        if process is not None:
+            process.wait()
+        
+        # 같은 파일이 두 번 들어가면 concat과 삭제가 중복되므로 순서를 유지한 채 제거
+        parts = [part for part in dict.fromkeys(parts) if os.path.exists(part) and os.path.getsize(part) > 0]
+        if len(parts) < 2:
+            return
+        
+        ffmpeg_path = shutil.which('ffmpeg')
+        if ffmpeg_path is None:
+            self.logger.warning(f"ffmpeg가 없어 분할된 녹화 파일 {len(parts)}개를 병합하지 않습니다.")
+            return
+        
+        base, ext = os.path.splitext(parts[0])
+        merged_file = f"{base}_merged{ext}"
+        list_file = f"{base}_parts.txt"
+        
+        try:
+            with open(list_file, 'w', encoding='utf-8') as f:
+                for part in parts:
+                    escaped = os.path.abspath(part).replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+            
+            self.logger.info(f"분할된 녹화 파일 {len(parts)}개 병합 시작: {merged_file}")
+            result = subprocess.run(
+                [ffmpeg_path, '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                 '-i', list_file, '-c', 'copy', merged_file],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+            
+            if result.returncode == 0:
+                for part in parts:
+                    os.remove(part)
+                self.logger.info(f"녹화 파일 병합 완료: {merged_file}")
+            else:
+                self.logger.error(f"녹화 파일 병합 실패 (원본 유지): {result.stderr.strip()}")
+                
+        except Exception as e:
+            self.logger.error(f"녹화 파일 병합 중 오류: {e}")
+        finally:
+            if os.path.exists(list_file):
+                os.remove(list_file)
+    
+    def handle_live_start(self, title: str, channel_name: str):
+        """라이브 시작 처리"""
+        self.logger.info(f"{channel_name}님의 방송이 시작되었습니다!")
+        self.logger.info(f"방송 제목: {title}")
+        self.logger.info(f"https://chzzk.naver.com/live/{self.channel_id}")
+        
+        # 지난 방송의 streamlink가 아직 끝나지 않았다면(--retry-streams 대기 등) 새 녹화와 겹치지 않게 종료
+        finishing = self._finishing_process
+        self._finishing_process = None
+        if finishing and finishing.poll() is None:
+            self.logger.warning(f"이전 방송의 녹화 프로세스를 종료합니다 (PID: {finishing.pid})")
+            finishing.terminate()
+        
+        self.current_title = title
+        self.current_channel_name = channel_name
+        self.session_parts = []
+        self.restart_count = 0
+        self._next_restart_at = 0.0
+        self.start_recording()
+    
+    def start_recording(self):
+        """녹화 시작 (재시도 로직 포함)"""
+        title, channel_name = self.current_title, self.current_channel_name
+        
+        for attempt in range(self.retry_count_max):
+            recording_process = self.run_streamlink(title, channel_name)
+            
+            if recording_process:
+                # 모니터링 워커에서 녹화 모니터링
+                self._monitor_pool.submit(self.monitor_recording, recording_process, title)
+                break
+            else:
+                self.logger.warning(f"녹화 시작 실패 (시도 {attempt + 1}/{self.retry_count_max})")
+                if attempt < self.retry_count_max - 1 and self._stop_event.wait(5):
+                    break
+    
+    def handle_live_end(self):
+        """라이브 종료 처리"""
+        self.logger.info("방송이 종료되었습니다.")
+        
+        # 진행 중인 녹화가 있다면 잠시 대기 (마무리가 길어지면 백그라운드에 맡기고 감시 계속)
+        process = self.current_recording_process
+        if process:
+            self.logger.info("녹화 완료를 기다리는 중...")
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.logger.info("녹화 마무리를 백그라운드에서 대기합니다")
+                self._finishing_process = process
+            self.current_recording_process = None
+        
+        # 워커에서 녹화 프로세스 종료를 기다린 뒤 분할 파일 병합
+        self._monitor_pool.submit(self._merge_session_parts, self.session_parts, process)
+        self.session_parts = []
+    
+    def check_recording_status(self):
+        """녹화 상태 확인 - 방송 중 프로세스가 종료되면 새 파일로 재시작 (연속 실패 시 백오프)"""
+        if not (self.current_recording_process and self._child_died.is_set()):
+            return
+        
+        now = time.monotonic()
+        if self._next_restart_at == 0.0:
+            # 한동안 정상 녹화됐다면 일시적인 끊김으로 보고 재시작 횟수 초기화
+            if now - self._recording_started_at >= RESTART_RESET_SECONDS:
+                self.restart_count = 0
+            
+            if self.restart_count >= RESTART_LIMIT:
+                self._child_died.clear()
+                self.current_recording_process = None
+                self.logger.error(f"녹화 재시작이 {RESTART_LIMIT}회 연속 실패했습니다. 이번 방송의 녹화를 중단합니다.")
+                return
+            
+            delay = min(RESTART_BACKOFF_MAX, RESTART_BACKOFF_BASE * (2 ** self.restart_count)) if self.restart_count else 0
+            self.restart_count += 1
+            self._next_restart_at = now + delay
+            self.logger.warning(
+                f"녹화 프로세스가 예기치 않게 종료되었습니다. "
+                f"{delay}초 후 녹화를 재시작합니다. ({self.restart_count}/{RESTART_LIMIT})"
+            )
+        
+        # 대기 시간이 지날 때까지는 다음 상태 확인에서 다시 판단
+        if now < self._next_restart_at:
+            return
+        
+        self._child_died.clear()
+        self._next_restart_at = 0.0
+        self.current_recording_process = None
+        self.start_recording()
+    
+    def process_live_status(self, status: Optional[str], title: Optional[str], channel_name: Optional[str]):
+        """라이브 상태 전환 처리 (HTTP 폴링/WebSocket 공용)"""
+        if status == STATUS_UNKNOWN:
+            # 요청 실패는 상태 변화로 보지 않고 직전 상태 유지 (녹화 중이면 프로세스만 확인)
+            if self.last_status == 'OPEN':
+                self.check_recording_status()
+            return
+        
+        if status == 'OPEN':
+            if self.last_status != 'OPEN':
+                self.handle_live_start(title, channel_name)
+            
+            # 녹화 중 상태 확인
+            self.check_recording_status()
+            
+        elif self.last_status == 'OPEN':
+            self.handle_live_end()
+            
+        self.last_status = status
+    
+    def _next_poll_interval(self, status: Optional[str], previous_status: Optional[str]) -> float:
+        """다음 폴링까지의 대기 시간 계산
+        
+        상태가 바뀐 직후에는 MIN_CHECK_INTERVAL로 빠르게 재확인하고, 오프라인이
+        계속되면 MAX_CHECK_INTERVAL까지 1.5배씩 늘린다. 온라인 중에는 10초를 넘기지 않는다.
+        """
+        is_open = status == 'OPEN'
+        
+        if is_open != (previous_status == 'OPEN'):
+            self.poll_interval = self.min_check_interval
+            self.offline_polls = 0
+        elif is_open:
+            self.poll_interval = min(self.poll_interval * 1.5, 10)
+        else:
+            self.offline_polls += 1
+            if self.offline_polls >= 3:
+                self.poll_interval = min(self.poll_interval * 1.5, self.max_check_interval)
+        
+        # 여러 인스턴스가 같은 시각에 API를 호출하지 않도록 ±10% 지터
+        return self.poll_interval * random.uniform(0.9, 1.1)
+    
+    def check_stream(self):
+        """스트림 상태 확인 및 녹화 관리"""
+        self.retry_count = 0
+        
+        while not self._stop_event.is_set():
+            try:
+                previous_status = self.last_status
+                status, title, channel_name = self.get_live_info()
+                self.process_live_status(status, title, channel_name)
+                
+                # 요청 실패 시에는 유지된 직전 상태 기준으로 간격 계산
+                delay = self._next_poll_interval(self.last_status, previous_status)
+                if self.last_status != 'OPEN':
+                    self.logger.info(f"오프라인 상태 - {delay:.0f}초 후 재확인")
+                self.retry_count = 0  # 성공 시 재시도 카운터 리셋
+                
+                if self._stop_event.wait(delay):
+                    break
+                
+            except KeyboardInterrupt:
+                self.logger.info("사용자에 의해 중단되었습니다.")
+                break
+                
+            except Exception as e:
+                self.retry_count += 1
+                self.logger.error(f"예기치 않은 오류 발생 (재시도 {self.retry_count}): {e}")
+                
+                if self.retry_count >= 5:
+                    self.logger.error("연속 오류가 5회 발생했습니다. 프로그램을 종료합니다.")
+                    break
+                    
+                # 일시적 오류는 빨리 복구하고, 장애가 길어지면 API 부하를 줄이도록 지터를 더한 지수 백오프
+                delay = min(ERROR_BACKOFF_MAX, ERROR_BACKOFF_BASE * (2 ** self.retry_count))
+                if self._stop_event.wait(delay * random.uniform(0.8, 1.2)):
+                    break
+    
+    async def watch_live_ws(self) -> bool:
+        """WebSocket으로 라이브 상태 이벤트 수신 (실험적)
+        
+        기본 엔드포인트와 구독 프레임은 확인된 프로토콜이 아니라 추정값이며 구독 응답도 확인하지 않는다.
+        연결이 끊기면 지수 백오프로 재연결하며, 연속 실패가 RETRY_COUNT를
+        넘으면 False를 반환해 HTTP 폴링으로 전환하도록 한다.
+        상태 이벤트를 받지 못해도 감지가 늦어지지 않도록 CHECK_INTERVAL마다 HTTP로도 상태를 다시 맞춘다.
+        """
+        # USE_WS=1 일 때만 필요하므로 기본 HTTP 폴링 경로에서는 불러오지 않음
+        import asyncio
+        import websockets
+        
+        cookie = f'NID_AUT={self.nid_aut}; NID_SES={self.nid_ses}'
+        subscribe_frame = json.dumps({
+            'type': 'subscribe',
+            'topic': 'liveStatus',
+            'channelId': self.channel_id,
+        })
+        failures = 0
+        
+        while not self.shutdown_flag:
+            try:
+                async with websockets.connect(
+                    self.ws_url,
+                    additional_headers={**self.headers, 'Cookie': cookie},
+                ) as ws:
+                    await ws.send(subscribe_frame)
+                    self.logger.info("WebSocket 라이브 상태 구독 시작")
+                    
+                    # 구독 직후 현재 상태를 HTTP로 동기화
+                    # (블로킹 호출은 워커 스레드에서 실행해 ping/pong이 멈추지 않도록 함)
+                    live_info = await asyncio.to_thread(self.get_live_info)
+                    await asyncio.to_thread(self.process_live_status, *live_info)
+                    last_sync = time.monotonic()
+                    
+                    while not self.shutdown_flag:
+                        try:
+                            message = await asyncio.wait_for(ws.recv(), timeout=10)
+                        except asyncio.TimeoutError:
+                            message = None
+                        
+                        # 이벤트가 오지 않거나 형식이 달라도 주기적으로 HTTP로 상태를 다시 맞춤
+                        if time.monotonic() - last_sync >= self.check_interval:
+                            live_info = await asyncio.to_thread(self.get_live_info)
+                            await asyncio.to_thread(self.process_live_status, *live_info)
+                            last_sync = time.monotonic()
+                        elif message is None and self.last_status == 'OPEN':
+                            # 이벤트가 없어도 녹화 프로세스 상태는 주기적으로 확인
+                            await asyncio.to_thread(self.check_recording_status)
+                        
+                        if message is None:
+                            continue
+                        
+                        event = json.loads(message)
+                        # "content": null 같은 프레임도 건너뛰도록 빈 dict로 대체
+                        content = (event.get('content', event) if isinstance(event, dict) else None) or {}
+                        if not isinstance(content, dict) or 'status' not in content:
+                            continue
+                        # 상태 이벤트를 실제로 받았을 때만 구독이 동작하는 것으로 보고 실패 횟수 초기화
+                        failures = 0
+                        await asyncio.to_thread(self.process_live_status, *self._parse_live_content(content))
+                        
+            except Exception as e:
+                failures += 1
+                if failures > self.retry_count_max:
+                    self.logger.error(f"WebSocket 재연결 실패가 {failures - 1}회 반복되었습니다: {e}")
+                    return False
+                    
+                delay = min(60, 2 ** failures)
+                self.logger.warning(f"WebSocket 연결 끊김 - {delay}초 후 재연결 ({failures}/{self.retry_count_max}): {e}")
+                await asyncio.sleep(delay)
+        
+        return True
+    
+    def start(self):
+        """녹화기 시작"""
+        self.logger.info("=" * 50)
+        self.logger.info("치지직 자동 녹화기 시작")
+        self.logger.info(f"채널 ID: {self.channel_id}")
+        self.logger.info(f"녹화 디렉토리: {self.record_dir}")
+        self.logger.info("=" * 50)
+        
+        # 의존성 확인
+        if not self.check_dependencies():
+            self.logger.error("의존성 확인 실패. 프로그램을 종료합니다.")
+            sys.exit(1)
+        
+        try:
+            if self.use_ws and importlib.util.find_spec('websockets') is None:
+                self.logger.warning("websockets 패키지가 없어 HTTP 폴링으로 동작합니다.")
+            elif self.use_ws:
+                import asyncio
+                self.logger.warning("USE_WS=1: 실험적인 WebSocket 구독을 사용합니다 (프로토콜 미확인, HTTP 재동기화 병행)")
+                if asyncio.run(self.watch_live_ws()):
+                    return
+                self.logger.warning("WebSocket을 사용할 수 없어 HTTP 폴링으로 전환합니다.")
+                
+            self.check_stream()
+        except Exception as e:
+            self.logger.error(f"메인 루프에서 치명적 오류 발생: {e}")
+            sys.exit(1)
+        finally:
+            self.logger.info("프로그램이 종료되었습니다.")
+
+
+def main():
+    """메인 함수"""
+    recorder = ChzzkRecorder()
+    recorder.start()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,21 +1,128 @@
+import os
+from dotenv import load_dotenv
+
+# 웹 서버 비동기 모드 (eventlet/gevent는 다른 모듈을 불러오기 전에 표준 라이브러리를 패치해야 함)
+# .env의 ASYNC_MODE도 반영되도록 패치 여부를 정하기 전에 먼저 로딩
+load_dotenv()
+ASYNC_MODE = os.getenv('ASYNC_MODE') or None
+try:
+    if ASYNC_MODE == 'eventlet':
+        import eventlet
+        # os까지 패치하면 os.read가 읽을 수 있을 때까지 대기해 비차단 stderr 읽기가 멈추므로 제외
+        eventlet.monkey_patch(os=False)
+    elif ASYNC_MODE == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+except ImportError:
+    print(f"⚠️ {ASYNC_MODE} 모듈이 설치되지 않아 기본 모드로 실행합니다.")
+    ASYNC_MODE = None
+
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import subprocess
 import datetime
 import logging
-import os
 import sys
 import signal
+import socket
 import threading
 import json
+import math
+import random
+import collections
+import html
+import functools
+import heapq
+import array
+import hashlib
+import ctypes
+import platform
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import Optional, Tuple, Dict, Any
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Any, List, Callable, Iterator
+from flask import Flask, request, redirect, url_for, Response, stream_with_context
 from flask_socketio import SocketIO, emit
+from markupsafe import escape
 import psutil
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:  # orjson이 없으면 표준 json으로 대체
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+# Chzzk API 요청 헤더
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+}
+
+# Streamlink 명령어 공통 부분 (채널 URL, 쿠키, 출력 파일은 녹화기에서 추가)
+STREAMLINK_BASE = (
+    'streamlink',
+    '--ffmpeg-copyts',
+    '--progress', 'no',
+    '--retry-streams', '3',
+    '--retry-open', '3',
+)
+
+# 파일명에 쓸 수 없는 문자 제거용 변환 테이블
+_FORBIDDEN_TABLE = str.maketrans('', '', '\\/:*?"<>|')
+
+# API 요청 실패로 라이브 상태를 알 수 없을 때의 상태값 (방송 종료로 취급하지 않음)
+STATUS_UNKNOWN = 'UNKNOWN'
+
+# 라이브 시작 이력 (요일·시간대별 방송 시작 분포 추정용)
+LIVE_HISTORY_FILE = 'live_history.json'
+LIVE_HISTORY_MAX = 500
+LIVE_HISTORY_MIN_SAMPLES = 5
+
+# 녹화 실패 시 보관할 streamlink stderr 마지막 부분 크기
+STDERR_TAIL_BYTES = 64 * 1024
+
+# 상태 푸시를 묶어 보내는 간격 (초)
+EMIT_COALESCE_SECONDS = 0.25
+
+# 상태 API로 내보낼 녹화 오류 메시지 최대 길이
+ERROR_TAIL_CHARS = 8192
+
+# streamlink 출력의 ANSI 색상/제어 코드
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+# 로그 형식
+LOG_FORMAT = "[%(asctime)s] [%(levelname)s] %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# /logs 에서 보여줄 최근 로그 줄 수
+LOG_BUFFER_SIZE = 1000
+
+
+class RingHandler(logging.Handler):
+    """최근 로그를 메모리 링 버퍼에 보관하는 핸들러 (웹 모드에서는 실시간 푸시)"""
+    
+    def __init__(self, maxlen: int):
+        super().__init__()
+        self.buffer: collections.deque = collections.deque(maxlen=maxlen)
+        self.listener: Optional[Callable[[Dict[str, str]], None]] = None
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.buffer.append(self.format(record))
+            if self.listener:
+                self.listener({'message': record.getMessage(), 'level': record.levelname.lower()})
+        except Exception:
+            self.handleError(record)
+
+
+_ring_handler = RingHandler(LOG_BUFFER_SIZE)
+_ring_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+
 
 class ChzzkRecorder:
     """치지직 자동 녹화기 메인 클래스"""
@@ -41,19 +148,51 @@ class ChzzkRecorder:
         self.retry_count: int = 0
         self.recording_info: Dict[str, Any] = {}
         
-        # 파일명에서 특수문자 제거 정규식
-        self.special_chars_remover = re.compile(r'[\\/:*?"<>|]')
+        # 감시 루프가 마지막으로 확인한 라이브 정보 (대시보드 조회 시 API 호출 없이 사용)
+        self._live_cache: Dict[str, Any] = {'status': None, 'title': None, 'channel_name': None, 'ts': 0}
+        self._live_cache_lock = threading.Lock()
+        # 다음 확인까지 예약된 간격 (오프라인 간격이 늘어나도 오래된 정보로 잘못 표시하지 않도록)
+        self._scheduled_interval: float = self.check_interval
+        
+        # 상태가 바뀔 때 호출되는 콜백 (웹 모드에서 SocketIO 푸시에 사용)
+        self.status_listener: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._last_notified: Optional[tuple] = None
+        
+        # 짧은 시간에 여러 번 바뀐 상태는 한 번만 푸시 (EMIT_COALESCE_SECONDS 단위로 묶음)
+        self._emit_lock = threading.Lock()
+        self._emit_pending = False
+        self._emit_timer: Optional[threading.Timer] = None
+        
+        # 대시보드 조회용 상태 JSON (상태 갱신 시에만 다시 직렬화)
+        self._status_blob: bytes = b''
+        self._status_blob_ts: float = 0
         
-        # 시그널 핸들러 등록
-        self._setup_signal_handlers()
+        # 감시 루프 대기를 즉시 깨우기 위한 이벤트 (종료·중지·웹 요청 시 set)
+        self._wake = threading.Event()
+        
+        # 녹화 중 streamlink stderr 처리 상태 (감시 루프에서 비차단으로 읽음)
+        self._recording_lock = threading.Lock()
+        self._stderr_tail: collections.deque = collections.deque()
+        self._stderr_tail_size = 0
+        self._stderr_pending = b''
+        
+        # 시그널 핸들러 등록 (signal.signal은 메인 스레드에서만 호출 가능)
+        if threading.current_thread() is threading.main_thread():
+            self._setup_signal_handlers()
     
     def _setup_logging(self):
         """로깅 설정"""
         self.logger = logging.getLogger('chzzk_recorder')
+        if _ring_handler not in self.logger.handlers:
+            self.logger.addHandler(_ring_handler)
+        
+        # 이미 설정되어 있으면 핸들러(로그 파일)를 다시 열지 않음
+        if logging.getLogger().handlers:
+            return
         logging.basicConfig(
             level=logging.INFO, 
-            format="[%(asctime)s] [%(levelname)s] %(message)s", 
-            datefmt="%Y-%m-%d %H:%M:%S",
+            format=LOG_FORMAT, 
+            datefmt=LOG_DATEFMT,
             handlers=[
                 logging.StreamHandler(),
                 logging.FileHandler('chzzk_recorder.log', encoding='utf-8')
@@ -66,15 +205,79 @@ class ChzzkRecorder:
         self.nid_aut = os.getenv('NID_AUT')
         self.nid_ses = os.getenv('NID_SES')
         self.record_dir = os.getenv('RECORD_DIR', './recordings')
+        
+        # 녹화 디렉토리는 시작 시 한 번만 확인·생성 (실패하면 의존성 확인에서 보고)
+        self._record_dir = Path(self.record_dir).resolve()
+        self._record_dir_error: Optional[OSError] = None
+        try:
+            self._record_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self._record_dir_error = e
+        
         self.check_interval = int(os.getenv('CHECK_INTERVAL', '60'))
         self.retry_count_max = int(os.getenv('RETRY_COUNT', '3'))
+        self._live_url = f'https://chzzk.naver.com/live/{self.channel_id}'
+        self._cookie_aut = f'NID_AUT={self.nid_aut}'
+        self._cookie_ses = f'NID_SES={self.nid_ses}'
+        self.poll_budget_per_day = int(os.getenv('POLL_BUDGET_PER_DAY', str(86400 // max(1, self.check_interval))))
+        self.live_history = self._load_live_history()
+    
+    def _load_live_history(self) -> List[float]:
+        """라이브 시작 이력 로딩"""
+        try:
+            with open(LIVE_HISTORY_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)[-LIVE_HISTORY_MAX:]
+        except (OSError, ValueError):
+            return []
+    
+    def _record_live_start(self):
+        """라이브 시작 시각 기록"""
+        self.live_history = (self.live_history + [time.time()])[-LIVE_HISTORY_MAX:]
+        try:
+            with open(LIVE_HISTORY_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.live_history, f)
+        except OSError as e:
+            self.logger.warning(f"라이브 이력 저장 실패: {e}")
+    
+    def _offline_check_interval(self) -> float:
+        """오프라인 상태의 다음 확인 간격 계산
+        
+        하루 POLL_BUDGET_PER_DAY회의 확인을 요일·시간대(168칸)별 방송 시작 확률 p의
+        제곱근에 비례해 배분한다 (예상 감지 지연을 최소화하는 배분).
+        이력이 충분하지 않으면 CHECK_INTERVAL을 그대로 사용한다.
+        """
+        if len(self.live_history) < LIVE_HISTORY_MIN_SAMPLES:
+            return self.check_interval
+        
+        # 0.5 가산 평활화로 이력이 없는 시간대도 완전히 배제하지 않음
+        counts = [0.5] * 168
+        for ts in self.live_history:
+            t = time.localtime(ts)
+            counts[t.tm_wday * 24 + t.tm_hour] += 1
+        
+        weights = [math.sqrt(c) for c in counts]
+        now = time.localtime()
+        share = weights[now.tm_wday * 24 + now.tm_hour] / sum(weights)
+        
+        # 주간 예산 중 현재 시간대 몫을 1시간 동안 균등하게 사용
+        polls_this_hour = self.poll_budget_per_day * 7 * share
+        interval = 3600 / polls_this_hour if polls_this_hour > 0 else float('inf')
+        return min(max(interval, 10), self.check_interval * 10)
     
     def _setup_api(self):
         """API 설정"""
         self.chzzk_api = f'https://api.chzzk.naver.com/service/v3/channels/{self.channel_id}/live-detail'
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-        }
+        
+        # keep-alive 연결을 재사용해 매 폴링마다 TCP/TLS 핸드셰이크를 생략
+        self.request_timeout = 10
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        
+        # 조건부 요청용 캐시 검증자와 직전 결과
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached_live_info: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
     
     def _setup_signal_handlers(self):
         """시그널 핸들러 설정"""
@@ -85,6 +288,7 @@ class ChzzkRecorder:
         """시그널 핸들러 - 우아한 종료"""
         self.logger.info("종료 신호를 받았습니다. 프로그램을 종료합니다...")
         self.shutdown_flag = True
+        self._wake.set()
         
         if self.current_recording_process:
             self.logger.info("진행 중인 녹화를 종료합니다...")
@@ -96,6 +300,7 @@ class ChzzkRecorder:
             except Exception as e:
                 self.logger.error(f"녹화 프로세스 종료 중 오류: {e}")
         
+        self.session.close()
         sys.exit(0)
     
     def check_dependencies(self) -> bool:
@@ -110,9 +315,9 @@ class ChzzkRecorder:
                 self.logger.error("Streamlink가 설치되지 않았습니다.")
                 return False
                 
-            # 녹화 디렉토리 생성
-            Path(self.record_dir).mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"녹화 디렉토리: {self.record_dir}")
+            if self._record_dir_error is not None:
+                raise self._record_dir_error
+            self.logger.info(f"녹화 디렉토리: {self._record_dir}")
             
             # 환경 변수 확인
             if not all([self.channel_id, self.nid_aut, self.nid_ses]):
@@ -128,37 +333,56 @@ class ChzzkRecorder:
     def get_live_info(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """라이브 상태 정보 가져오기"""
         try:
-            response = requests.get(self.chzzk_api, headers=self.headers, timeout=10)
+            # 변경이 없으면 304로 본문 없이 응답받아 직전 결과를 재사용
+            conditional_headers = {}
+            if self._etag:
+                conditional_headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                conditional_headers['If-Modified-Since'] = self._last_modified
+            
+            response = self.session.get(self.chzzk_api, headers=conditional_headers, timeout=self.request_timeout)
+            if response.status_code == 304 and self._cached_live_info is not None:
+                return self._cached_live_info
             response.raise_for_status()
             
-            data = response.json()
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            
+            data = json_loads(response.content)
             content = data.get('content')
             
             if content is None:
                 self.logger.info("채널이 장기간 스트리밍하지 않았습니다.")
-                return None, None, None
-                
-            status = content.get('status')
-            title = content.get('liveTitle', 'Unknown Title')
-            channel_name = content.get('channel', {}).get('channelName', 'UnknownChannel')
+                live_info = (None, None, None)
+            else:
+                status = content.get('status')
+                title = content.get('liveTitle', 'Unknown Title')
+                channel_name = content.get('channel', {}).get('channelName', 'UnknownChannel')
+                live_info = (status, title, channel_name)
             
-            return status, title, channel_name
+            self._cached_live_info = live_info
+            return live_info
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API 요청 실패: {e}")
-            return None, None, None
+            return STATUS_UNKNOWN, None, None
         except Exception as e:
             self.logger.error(f"라이브 정보 가져오기 실패: {e}")
-            return None, None, None
+            return STATUS_UNKNOWN, None, None
     
     def run_streamlink(self, title: str, channel_name: str) -> Optional[subprocess.Popen]:
         """Streamlink를 사용하여 녹화 시작"""
         try:
             # 파일명 생성
-            cleaned_title = self.special_chars_remover.sub('', title.strip())
+            cleaned_title = title.strip().translate(_FORBIDDEN_TABLE)
             current_time = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
             file_name = f"{current_time}_{channel_name}_{cleaned_title}"
-            output_file = os.path.join(self.record_dir, f"{file_name}.mp4")
+            output_file = str(self._record_dir / f"{file_name}.mp4")
+            
+            # 시작 시 만들지 못한 디렉토리는 녹화 직전에 다시 시도 (웹 모드는 의존성 확인을 거치지 않음)
+            if self._record_dir_error is not None:
+                self._record_dir.mkdir(parents=True, exist_ok=True)
+                self._record_dir_error = None
             
             self.logger.info(f"녹화 시작: {output_file}")
             
@@ -173,26 +397,28 @@ class ChzzkRecorder:
             
             # Streamlink 명령어 구성
             cmd = [
-                'streamlink',
-                '--ffmpeg-copyts',
-                '--progress', 'no',
-                '--retry-streams', '3',
-                '--retry-open', '3',
-                f'https://chzzk.naver.com/live/{self.channel_id}',
+                *STREAMLINK_BASE,
+                self._live_url,
                 'best',
-                '--http-cookie', f'NID_AUT={self.nid_aut}',
-                '--http-cookie', f'NID_SES={self.nid_ses}',
+                '--http-cookie', self._cookie_aut,
+                '--http-cookie', self._cookie_ses,
                 '--output', output_file
             ]
             
             # 비동기로 Streamlink 실행
-            self.current_recording_process = subprocess.Popen(
+            process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             
+            # 감시 루프가 멈추지 않도록 stderr를 비차단 모드로 전환
+            os.set_blocking(process.stderr.fileno(), False)
+            self._stderr_tail = collections.deque()
+            self._stderr_tail_size = 0
+            self._stderr_pending = b''
+            self.current_recording_process = process
+            
             self.logger.info(f"녹화 프로세스 시작됨 (PID: {self.current_recording_process.pid})")
             
             return self.current_recording_process
@@ -202,104 +428,226 @@ class ChzzkRecorder:
             self.current_recording_process = None
             return None
     
-    def monitor_recording(self, process: subprocess.Popen, title: str):
-        """녹화 프로세스 모니터링"""
-        try:
-            stdout, stderr = process.communicate()
+    def _read_stderr(self, process: subprocess.Popen):
+        """streamlink stderr에 쌓인 만큼만 비차단으로 읽어 로그로 전달
+        
+        전체 출력을 메모리에 모으지 않고 마지막 부분만 보관하며, 파이프가 가득 차
+        streamlink가 멈추는 일도 막는다.
+        """
+        fd = process.stderr.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                return
+            if not chunk:
+                return
             
-            if process.returncode == 0:
-                self.logger.info(f"녹화 완료: {title}")
-                self.recording_info['status'] = 'completed'
-                self.recording_info['end_time'] = datetime.datetime.now().isoformat()
-            else:
-                self.logger.error(f"녹화 실패 (종료 코드: {process.returncode})")
-                self.recording_info['status'] = 'failed'
-                self.recording_info['error'] = stderr
-                if stderr:
-                    self.logger.error(f"오류 메시지: {stderr}")
-                    
-        except Exception as e:
-            self.logger.error(f"녹화 모니터링 중 오류: {e}")
-            self.recording_info['status'] = 'error'
-            self.recording_info['error'] = str(e)
-        finally:
-            self.current_recording_process = None
+            *lines, self._stderr_pending = (self._stderr_pending + chunk).split(b'\n')
+            for raw_line in lines:
+                line = _ANSI_RE.sub('', raw_line.decode('utf-8', errors='replace')).rstrip()
+                if not line:
+                    continue
+                self.logger.debug(f"[streamlink] {line}")
+                self._stderr_tail.append(line)
+                self._stderr_tail_size += len(line.encode('utf-8'))
+                while self._stderr_tail_size > STDERR_TAIL_BYTES:
+                    self._stderr_tail_size -= len(self._stderr_tail.popleft().encode('utf-8'))
+    
+    def _finalize_recording(self, process: subprocess.Popen, stopped: bool = False):
+        """종료된 녹화 프로세스 정리 및 녹화 정보 갱신"""
+        with self._recording_lock:
+            if self.current_recording_process is not process:
+                return
+            
+            try:
+                self._read_stderr(process)
+                if self._stderr_pending.strip():
+                    self._stderr_tail.append(_ANSI_RE.sub('', self._stderr_pending.decode('utf-8', errors='replace')).rstrip())
+                process.stderr.close()
+                stderr = '\n'.join(self._stderr_tail)
+                
+                if stopped:
+                    self.recording_info['status'] = 'stopped'
+                    self.recording_info['end_time'] = datetime.datetime.now().isoformat()
+                elif process.returncode == 0:
+                    self.logger.info(f"녹화 완료: {self.recording_info.get('title')}")
+                    self.recording_info['status'] = 'completed'
+                    self.recording_info['end_time'] = datetime.datetime.now().isoformat()
+                else:
+                    self.logger.error(f"녹화 실패 (종료 코드: {process.returncode})")
+                    self.recording_info['status'] = 'failed'
+                    error_tail = stderr[-ERROR_TAIL_CHARS:]
+                    self.recording_info['error'] = error_tail
+                    if error_tail:
+                        self.logger.error(f"오류 메시지: {error_tail}")
+                        
+            except Exception as e:
+                self.logger.error(f"녹화 정리 중 오류: {e}")
+                self.recording_info['status'] = 'error'
+                self.recording_info['error'] = str(e)
+            finally:
+                self.current_recording_process = None
+        
+        self._notify_status()
     
     def handle_live_start(self, title: str, channel_name: str):
         """라이브 시작 처리"""
         self.logger.info(f"{channel_name}님의 방송이 시작되었습니다!")
         self.logger.info(f"방송 제목: {title}")
-        self.logger.info(f"https://chzzk.naver.com/live/{self.channel_id}")
+        self.logger.info(self._live_url)
+        self._record_live_start()
         
         # 녹화 시작 (재시도 로직 포함)
         for attempt in range(self.retry_count_max):
             recording_process = self.run_streamlink(title, channel_name)
             
+            # 녹화 프로세스는 감시 루프의 check_recording_status에서 관리
             if recording_process:
-                # 별도 스레드에서 녹화 모니터링
-                monitor_thread = threading.Thread(
-                    target=self.monitor_recording,
-                    args=(recording_process, title)
-                )
-                monitor_thread.daemon = True
-                monitor_thread.start()
                 break
             else:
                 self.logger.warning(f"녹화 시작 실패 (시도 {attempt + 1}/{self.retry_count_max})")
                 if attempt < self.retry_count_max - 1:
-                    time.sleep(5)
+                    self._sleep(self._backoff(attempt))
     
     def handle_live_end(self):
         """라이브 종료 처리"""
         self.logger.info("방송이 종료되었습니다.")
         
-        # 진행 중인 녹화가 있다면 대기
-        if self.current_recording_process:
+        # 진행 중인 녹화가 있다면 stderr를 비우면서 대기
+        process = self.current_recording_process
+        if process:
             self.logger.info("녹화 완료를 기다리는 중...")
-            self.current_recording_process.wait()
-            self.current_recording_process = None
+            # 종료 신호나 사용자 중지(stop_recording)가 오면 바로 빠져나옴
+            while process.poll() is None and not self.shutdown_flag:
+                with self._recording_lock:
+                    if self.current_recording_process is not process:
+                        break
+                    self._read_stderr(process)
+                self._sleep(1)
+            if process.poll() is not None:
+                self._finalize_recording(process)
     
     def check_recording_status(self):
-        """녹화 상태 확인"""
-        if self.current_recording_process:
-            if self.current_recording_process.poll() is not None:
-                self.logger.warning("녹화 프로세스가 예기치 않게 종료되었습니다.")
-                self.current_recording_process = None
+        """녹화 상태 확인 (쌓인 stderr를 읽고, 프로세스가 끝났으면 정리)"""
+        process = self.current_recording_process
+        if not process:
+            return
+        
+        with self._recording_lock:
+            if self.current_recording_process is process:
+                self._read_stderr(process)
+        
+        if process.poll() is not None:
+            self._finalize_recording(process)
+    
+    def _update_live_cache(self, status: Optional[str], title: Optional[str], channel_name: Optional[str]):
+        """라이브 정보 캐시 갱신"""
+        with self._live_cache_lock:
+            self._live_cache = {'status': status, 'title': title, 'channel_name': channel_name, 'ts': time.time()}
     
     def get_status(self) -> Dict[str, Any]:
         """현재 상태 정보 반환"""
-        status, title, channel_name = self.get_live_info()
+        with self._live_cache_lock:
+            live = dict(self._live_cache)
         
         return {
-            'live_status': status,
-            'live_title': title,
-            'channel_name': channel_name,
+            'live_status': live['status'],
+            'live_title': live['title'],
+            'channel_name': live['channel_name'],
+            'live_checked_at': live['ts'] or None,
+            'live_stale': time.time() - live['ts'] > 2 * max(self.check_interval, self._scheduled_interval),
             'recording_status': self.recording_info.get('status', 'idle'),
             'recording_info': self.recording_info,
             'is_recording': self.current_recording_process is not None,
             'process_pid': self.current_recording_process.pid if self.current_recording_process else None,
             'last_status': self.last_status,
             'retry_count': self.retry_count,
-            'shutdown_flag': self.shutdown_flag
+            'shutdown_flag': self.shutdown_flag,
+            'channel_id': self.channel_id,
+            'record_dir': self.record_dir
         }
     
+    def _refresh_status_blob(self, status: Dict[str, Any]):
+        """상태 JSON 다시 직렬화 (bytes 대입이라 조회 쪽은 락 없이 읽음)"""
+        self._status_blob = json_dumps(status)
+        self._status_blob_ts = time.time()
+    
+    def get_status_blob(self) -> bytes:
+        """직렬화된 상태 JSON (감시 루프가 멈춰 오래됐으면 새로 생성)"""
+        if time.time() - self._status_blob_ts > self.check_interval:
+            self._refresh_status_blob(self.get_status())
+        return self._status_blob
+    
+    def _notify_status(self):
+        """상태 JSON을 갱신하고 status_listener 푸시 예약"""
+        self._refresh_status_blob(self.get_status())
+        
+        if self.status_listener is not None:
+            self._schedule_emit()
+    
+    def _schedule_emit(self):
+        """푸시가 예약되어 있지 않으면 EMIT_COALESCE_SECONDS 뒤로 예약"""
+        with self._emit_lock:
+            if self._emit_pending:
+                return
+            self._emit_pending = True
+            self._emit_timer = threading.Timer(EMIT_COALESCE_SECONDS, self._do_emit)
+            self._emit_timer.daemon = True
+            self._emit_timer.start()
+    
+    def _do_emit(self):
+        """예약된 푸시 실행 (라이브/녹화 상태가 바뀌었을 때만 전달)"""
+        with self._emit_lock:
+            self._emit_pending = False
+            self._emit_timer = None
+        
+        listener = self.status_listener
+        if listener is None:
+            return
+        
+        status = self.get_status()
+        key = (status['live_status'], status['live_title'], status['is_recording'], status['recording_status'])
+        if key == self._last_notified:
+            return
+        
+        self._last_notified = key
+        try:
+            listener(status)
+        except Exception as e:
+            self.logger.error(f"상태 알림 전송 실패: {e}")
+    
     def stop_recording(self):
         """녹화 중지"""
-        if self.current_recording_process:
+        process = self.current_recording_process
+        if process:
             self.logger.info("사용자 요청으로 녹화를 중지합니다...")
             try:
-                self.current_recording_process.terminate()
-                self.current_recording_process.wait(timeout=10)
+                process.terminate()
+                process.wait(timeout=10)
                 self.logger.info("녹화가 중지되었습니다.")
             except subprocess.TimeoutExpired:
-                self.current_recording_process.kill()
+                process.kill()
+                process.wait()
                 self.logger.info("녹화 프로세스를 강제 종료했습니다.")
             except Exception as e:
                 self.logger.error(f"녹화 중지 중 오류: {e}")
             finally:
-                self.current_recording_process = None
-                self.recording_info['status'] = 'stopped'
-                self.recording_info['end_time'] = datetime.datetime.now().isoformat()
+                self._finalize_recording(process, stopped=True)
+                self.wake()
+    
+    def wake(self):
+        """감시 루프 대기를 즉시 깨움"""
+        self._wake.set()
+    
+    def _sleep(self, seconds: float):
+        """wake() 호출 시 바로 깨어나는 대기"""
+        self._wake.wait(timeout=seconds)
+        self._wake.clear()
+    
+    def _backoff(self, attempt: int) -> float:
+        """재시도 대기 시간 (지터를 더한 지수 백오프, 최대 300초)"""
+        return min(300, 2 ** attempt) * random.uniform(0.5, 1.5)
     
     def check_stream(self):
         """스트림 상태 확인 및 녹화 관리"""
@@ -308,25 +656,38 @@ class ChzzkRecorder:
         while not self.shutdown_flag:
             try:
                 status, title, channel_name = self.get_live_info()
+                if status == STATUS_UNKNOWN:
+                    # 요청 실패는 상태 변화로 보지 않고 직전 상태 유지
+                    # (가짜 종료·시작이 라이브 이력에 기록되지 않도록, 캐시는 그대로 두어 오래된 정보로 표시)
+                    status = self.last_status
+                else:
+                    self._update_live_cache(status, title, channel_name)
+                
+                # 녹화 중 상태 확인 (stderr 읽기 및 종료된 녹화 정리)
+                self.check_recording_status()
                 
                 if status == 'OPEN':
                     if self.last_status != 'OPEN':
                         self.handle_live_start(title, channel_name)
                     
-                    # 녹화 중 상태 확인
-                    self.check_recording_status()
-                    time.sleep(10)  # 온라인 상태일 때는 10초마다 확인
+                    interval = 10  # 온라인 상태일 때는 10초마다 확인
                     
                 else:
                     if self.last_status == 'OPEN':
                         self.handle_live_end()
                         
-                    self.logger.info(f"오프라인 상태 - {self.check_interval}초 후 재확인")
-                    time.sleep(self.check_interval)
+                    # 여러 녹화기가 같은 시각에 API를 호출하지 않도록 ±10% 지터
+                    interval = self._offline_check_interval() * random.uniform(0.9, 1.1)
+                    self.logger.info(f"오프라인 상태 - {interval:.0f}초 후 재확인")
                     
                 self.last_status = status
                 self.retry_count = 0  # 성공 시 재시도 카운터 리셋
                 
+                # 대기 전에 바뀐 상태를 바로 푸시
+                self._scheduled_interval = interval
+                self._notify_status()
+                self._sleep(interval)
+                
             except KeyboardInterrupt:
                 self.logger.info("사용자에 의해 중단되었습니다.")
                 break
@@ -339,7 +700,7 @@ class ChzzkRecorder:
                     self.logger.error("연속 오류가 5회 발생했습니다. 프로그램을 종료합니다.")
                     break
                     
-                time.sleep(30)  # 오류 발생 시 30초 대기
+                self._sleep(self._backoff(self.retry_count))
     
     def start(self):
         """녹화기 시작"""
@@ -366,17 +727,18 @@ class ChzzkRecorder:
 # Flask 웹 서버 설정
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'chzzk-recorder-secret-key'
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
 
 # 전역 녹화기 인스턴스
 recorder = None
 monitor_thread = None
+_recorder_lock = threading.Lock()
 
 
 def create_templates():
-    """HTML 템플릿 생성"""
-    templates_dir = Path('templates')
-    templates_dir.mkdir(exist_ok=True)
+    """메인 페이지 HTML 생성 (Jinja 렌더링 없이 정적 파일로 제공)"""
+    static_dir = Path(app.static_folder)
+    static_dir.mkdir(exist_ok=True)
     
     # 메인 HTML 템플릿
     html_template = '''<!DOCTYPE html>
@@ -627,12 +989,12 @@ def create_templates():
 
     <script>
         const socket = io();
-        let statusUpdateInterval;
         
-        // 소켓 연결
+        // 소켓 연결 - 연결 직후 현재 상태를 한 번 요청하고 이후에는 서버 푸시로 갱신
         socket.on('connect', function() {
             console.log('웹소켓 연결됨');
             addLog('웹소켓 연결됨', 'info');
+            socket.emit('request_status');
         });
         
         // 상태 업데이트 수신
@@ -753,69 +1115,120 @@ def create_templates():
                     addLog('상태 새로고침 실패: ' + error.message, 'error');
                 });
         }
-        
-        // 페이지 로드 시 상태 확인
-        document.addEventListener('DOMContentLoaded', function() {
-            refreshStatus();
-            
-            // 5초마다 상태 자동 업데이트
-            statusUpdateInterval = setInterval(refreshStatus, 5000);
-        });
-        
-        // 페이지 언로드 시 인터벌 정리
-        window.addEventListener('beforeunload', function() {
-            if (statusUpdateInterval) {
-                clearInterval(statusUpdateInterval);
-            }
-        });
+
     </script>
 </body>
 </html>'''
     
-    with open(templates_dir / 'index.html', 'w', encoding='utf-8') as f:
+    # 내용이 바뀌지 않았으면 다시 쓰지 않음 (해시는 옆의 .hash 파일에 기록)
+    index_path = static_dir / 'index.html'
+    hash_path = static_dir / '.hash'
+    digest = hashlib.blake2b(html_template.encode('utf-8'), digest_size=16).hexdigest()
+    try:
+        if index_path.exists() and hash_path.read_text(encoding='utf-8').strip() == digest:
+            return
+    except OSError:
+        pass
+    
+    with open(index_path, 'w', encoding='utf-8') as f:
         f.write(html_template)
+    hash_path.write_text(digest, encoding='utf-8')
+
+
+# 녹화기 초기화 전 상태
+NOT_INITIALIZED_STATUS = {
+    'live_status': 'unknown',
+    'recording_status': 'not_initialized',
+    'is_recording': False
+}
+_NOT_INITIALIZED_BLOB = json_dumps(NOT_INITIALIZED_STATUS)
+
+
+def get_recorder() -> ChzzkRecorder:
+    """전역 녹화기 (처음 필요할 때 한 번만 생성)"""
+    global recorder
+    
+    if recorder is None:
+        with _recorder_lock:
+            if recorder is None:
+                new_recorder = ChzzkRecorder()
+                new_recorder.status_listener = push_status
+                recorder = new_recorder
+    return recorder
+
+
+def status_snapshot() -> Dict[str, Any]:
+    """현재 상태 (녹화기가 없으면 초기화 전 상태)"""
+    if recorder:
+        return recorder.get_status()
+    return NOT_INITIALIZED_STATUS
+
+
+def push_status(status: Dict[str, Any]):
+    """연결된 모든 클라이언트에 상태 푸시"""
+    socketio.emit('status_update', status)
+
+
+def push_log(entry: Dict[str, str]):
+    """연결된 모든 클라이언트에 로그 푸시 (클라이언트가 innerHTML로 넣으므로 이스케이프)"""
+    socketio.emit('log_update', {'message': html.escape(entry['message']), 'level': entry['level']})
 
 
 @app.route('/')
 def index():
     """메인 페이지"""
-    return render_template('index.html')
+    return app.send_static_file('index.html')
+
+
+@app.after_request
+def add_cache_headers(response: Response) -> Response:
+    """정적 페이지는 브라우저 캐시 사용 (로그·파일 목록 같은 동적 페이지와 오류 응답은 제외)"""
+    if response.status_code == 200 and request.endpoint in ('index', 'static'):
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+
+def _ojsonify(payload: Dict[str, Any]) -> Response:
+    """JSON 응답 생성 (orjson이 있으면 bytes로 바로 직렬화)"""
+    return Response(json_dumps(payload), mimetype='application/json')
 
 
 @app.route('/api/status')
 def api_status():
     """상태 정보 API"""
-    global recorder
-    if recorder:
-        status = recorder.get_status()
-        status.update({
-            'channel_id': recorder.channel_id,
-            'record_dir': recorder.record_dir
-        })
-        return jsonify(status)
-    else:
-        return jsonify({
-            'live_status': 'unknown',
-            'recording_status': 'not_initialized',
-            'is_recording': False
-        })
+    # 상태가 바뀔 때만 만들어 둔 JSON을 그대로 전송
+    body = recorder.get_status_blob() if recorder else _NOT_INITIALIZED_BLOB
+    return Response(body, mimetype='application/json')
+
+
+@socketio.on('request_status')
+def on_request_status():
+    """연결 직후 클라이언트에 현재 상태 전송"""
+    emit('status_update', status_snapshot())
 
 
 @app.route('/api/start', methods=['POST'])
 def api_start():
     """모니터링 시작"""
-    global recorder, monitor_thread
-    
-    if monitor_thread and monitor_thread.is_alive():
-        return jsonify({'success': False, 'message': '이미 모니터링이 실행 중입니다.'})
+    global monitor_thread
     
     try:
-        recorder = ChzzkRecorder()
-        monitor_thread = threading.Thread(target=recorder.check_stream, daemon=True)
-        monitor_thread.start()
-        return jsonify({'success': True, 'message': '모니터링이 시작되었습니다.'})
+        rec = get_recorder()
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return _ojsonify({'success': False, 'message': str(e)})
+    
+    with _recorder_lock:
+        if monitor_thread and monitor_thread.is_alive():
+            return _ojsonify({'success': False, 'message': '이미 모니터링이 실행 중입니다.'})
+        
+        try:
+            # 기존 녹화기를 재사용하고 감시 스레드만 다시 시작
+            rec.shutdown_flag = False
+            monitor_thread = threading.Thread(target=rec.check_stream, daemon=True)
+            monitor_thread.start()
+            return _ojsonify({'success': True, 'message': '모니터링이 시작되었습니다.'})
+        except Exception as e:
+            return _ojsonify({'success': False, 'message': str(e)})
 
 
 @app.route('/api/stop', methods=['POST'])
@@ -824,51 +1237,130 @@ def api_stop():
     global recorder
     
     if not recorder:
-        return jsonify({'success': False, 'message': '녹화기가 초기화되지 않았습니다.'})
+        return _ojsonify({'success': False, 'message': '녹화기가 초기화되지 않았습니다.'})
     
     try:
         recorder.stop_recording()
-        return jsonify({'success': True, 'message': '녹화가 중지되었습니다.'})
+        return _ojsonify({'success': True, 'message': '녹화가 중지되었습니다.'})
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return _ojsonify({'success': False, 'message': str(e)})
+
+
+@app.route('/api/wake', methods=['POST'])
+def api_wake():
+    """감시 루프를 깨워 라이브 상태 즉시 재확인"""
+    if not recorder:
+        return _ojsonify({'success': False, 'message': '녹화기가 초기화되지 않았습니다.'})
+    
+    recorder.wake()
+    return _ojsonify({'success': True, 'message': '상태를 다시 확인합니다.'})
 
 
 @app.route('/logs')
 def view_logs():
-    """로그 파일 보기"""
-    try:
-        with open('chzzk_recorder.log', 'r', encoding='utf-8') as f:
-            logs = f.read()
-        return f'<pre style="background: #1e1e1e; color: #00ff00; padding: 20px; font-family: monospace;">{logs}</pre>'
-    except FileNotFoundError:
-        return '<p>로그 파일을 찾을 수 없습니다.</p>'
+    """최근 로그 보기 (메모리 버퍼에서 제공, ?tail=N 이면 마지막 N줄)"""
+    lines = list(_ring_handler.buffer)
+    
+    tail_lines = request.args.get('tail', type=int)
+    if tail_lines:
+        lines = lines[-tail_lines:]
+    
+    return ('<pre style="background: #1e1e1e; color: #00ff00; padding: 20px; font-family: monospace;">'
+            + html.escape('\n'.join(lines))
+            + '</pre>')
 
 
-@app.route('/files')
-def view_files():
-    """녹화 파일 목록"""
-    global recorder
-    
-    if not recorder:
-        return '<p>녹화기가 초기화되지 않았습니다.</p>'
+# statx(2) 상수 (linux/fcntl.h, linux/stat.h)
+# ctypes 호출 비용 때문에 로컬 디스크에서는 DirEntry.stat보다 느리므로, 네트워크로 마운트된
+# 녹화 폴더에서 AT_STATX_DONT_SYNC가 도움이 될 때만 STATX_DONT_SYNC=1로 켜서 사용
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+_STATX_SIZE = 0x200
+_SYS_STATX = {'x86_64': 332, 'aarch64': 291}
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('_reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx (256바이트, 목록에 쓰는 필드까지만 이름을 붙임)"""
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('_spare', ctypes.c_uint8 * 128),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _statx_syscall() -> Optional[Callable[..., int]]:
+    """statx 호출 함수 (STATX_DONT_SYNC=1이고 Linux x86_64/aarch64에서 실제로 동작할 때만, 아니면 None)"""
+    if os.getenv('STATX_DONT_SYNC', '0') != '1' or platform.system() != 'Linux':
+        return None
+    number = _SYS_STATX.get(platform.machine())
+    if number is None:
+        return None
     
     try:
-        record_dir = Path(recorder.record_dir)
-        files = []
-        
-        for file_path in record_dir.glob('*.mp4'):
-            stat = file_path.stat()
-            files.append({
-                'name': file_path.name,
-                'size': stat.st_size,
-                'modified': datetime.datetime.fromtimestamp(stat.st_mtime),
-                'path': str(file_path)
-            })
-        
-        # 최신 파일부터 정렬
-        files.sort(key=lambda x: x['modified'], reverse=True)
-        
-        html = '''
+        syscall = ctypes.CDLL('libc.so.6', use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+    syscall.restype = ctypes.c_long
+    
+    def call(path: bytes, buf: _Statx) -> int:
+        return syscall(ctypes.c_long(number), ctypes.c_int(_AT_FDCWD), ctypes.c_char_p(path),
+                       ctypes.c_int(_AT_STATX_DONT_SYNC | _AT_SYMLINK_NOFOLLOW), ctypes.c_uint(_STATX_SIZE | _STATX_MTIME),
+                       ctypes.byref(buf))
+    
+    # 오래된 커널·seccomp 환경에서는 ENOSYS/EPERM이므로 한 번 시험해 봄
+    if call(b'.', _Statx()) != 0:
+        return None
+    return call
+
+
+def _statx_fast(path: str) -> Optional[Tuple[int, int]]:
+    """statx로 (크기, mtime_ns) 조회 (AT_STATX_DONT_SYNC로 캐시된 inode 정보 사용, 실패 시 None)"""
+    call = _statx_syscall()
+    if call is None:
+        return None
+    
+    buf = _Statx()
+    if call(os.fsencode(path), buf) != 0:
+        return None
+    return buf.stx_size, buf.stx_mtime.tv_sec * 1_000_000_000 + buf.stx_mtime.tv_nsec
+
+
+# /files 에 보여줄 최근 파일 수 기본값 (?limit=N 으로 변경, 최대 MAX_FILES_LIMIT)
+MAX_FILES = 200
+MAX_FILES_LIMIT = 5000
+
+# 파일이 이보다 많으면 나머지 항목의 stat은 스레드 풀에서 STAT_CHUNK개씩 나눠 동시에 조회
+STAT_PARALLEL_MIN = 256
+STAT_CHUNK = 64
+_STAT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='files-stat')
+
+# /files 페이지 HTML 조각 (행 자리표시자 0: 파일명, 1: 크기(MB), 2: 수정 시각)
+_FILES_HEAD = '''
         <!DOCTYPE html>
         <html>
         <head>
@@ -884,51 +1376,208 @@ def view_files():
             <h1>📁 녹화 파일 목록</h1>
             <a href="/">← 메인으로 돌아가기</a>
         '''
-        
-        for file in files:
-            size_mb = file['size'] / (1024 * 1024)
-            html += f'''
+_FILES_ROW = '''
             <div class="file-item">
-                <div class="file-name">{file['name']}</div>
+                <div class="file-name">{0}</div>
                 <div class="file-info">
-                    크기: {size_mb:.1f} MB | 
-                    수정: {file['modified'].strftime('%Y-%m-%d %H:%M:%S')}
+                    크기: {1:.1f} MB | 
+                    수정: {2}
                 </div>
             </div>
             '''
+_FILES_TAIL = '</body></html>'
+# 목록이 잘렸을 때 표시 (0: 표시 개수, 1: 전체 개수, 2: 더 보기 링크)
+_FILES_TRUNCATED = '''
+            <p class="file-info">최근 {0}개 표시 (전체 {1}개){2}</p>
+            '''
+_FILES_MORE_LINK = ' · <a href="/files?limit={0}">더 보기</a>'
+
+# 고정 조각은 미리 UTF-8로 인코딩 (응답을 bytes로 보내 Werkzeug의 인코딩 단계 생략)
+_FILES_HEAD_B = _FILES_HEAD.encode('utf-8')
+_FILES_TAIL_B = _FILES_TAIL.encode('utf-8')
+
+# /files 렌더링 결과 캐시 (폴더 mtime과 녹화 중인 파일 크기가 같으면 재사용)
+# (키와 본문을 한 튜플로 한 번에 교체해 다른 요청이 새 키와 이전 본문을 함께 보지 않도록 함)
+_FILES_CACHE: Dict[str, Optional[Tuple[tuple, bytes]]] = {'entry': None}
+
+
+def _files_cache_key(rec: 'ChzzkRecorder') -> tuple:
+    """파일 목록 캐시 키 (파일 추가·삭제는 폴더 mtime, 녹화 진행은 녹화 중인 파일 크기로 감지)"""
+    active_size = None
+    if rec.current_recording_process:
+        try:
+            active_size = os.stat(rec.recording_info['output_file']).st_size
+        except (KeyError, OSError):
+            pass
+    return os.stat(rec.record_dir).st_mtime_ns, active_size
+
+
+def _entry_stat(entry: os.DirEntry) -> Tuple[int, int]:
+    """(크기, mtime_ns) 조회 (statx 우선, 안 되면 DirEntry.stat)"""
+    stat = _statx_fast(entry.path)
+    if stat is None:
+        entry_stat = entry.stat(follow_symlinks=False)
+        stat = (entry_stat.st_size, entry_stat.st_mtime_ns)
+    return stat
+
+
+def _stat_entries(entries: List[os.DirEntry]) -> List[Tuple[int, int]]:
+    """항목 묶음의 (크기, mtime_ns) 조회 (스레드 풀 작업 단위)"""
+    return [_entry_stat(entry) for entry in entries]
+
+
+def _scan_recordings(record_dir: str, limit: int) -> Tuple[List[Tuple[str, int, int]], int]:
+    """녹화 폴더 스캔 (최근 limit개의 (파일명, 크기, mtime_ns) 목록과 전체 파일 수)"""
+    # 스캔 중에는 항목별 객체 대신 열 단위 배열에 모음 (크기·mtime은 8바이트 정수 배열)
+    names: List[str] = []
+    sizes = array.array('q')
+    mtimes = array.array('q')
+    add_name, add_size, add_mtime = names.append, sizes.append, mtimes.append
+    
+    # stat 시스템 콜 동안은 GIL이 풀리므로, 파일이 많으면 나머지는 모아 두었다가 여러 스레드로 지연을 숨김
+    # (eventlet/gevent 모드에서는 풀 스레드도 그린 스레드라 statx 호출이 겹치지 않으므로 직접 조회)
+    parallel = ASYNC_MODE is None
+    pending: List[os.DirEntry] = []
+    with os.scandir(record_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(('.mp4', '.MP4')) or not entry.is_file(follow_symlinks=False):
+                continue
+            if parallel and len(names) >= STAT_PARALLEL_MIN:
+                pending.append(entry)
+                continue
+            stat = _statx_fast(entry.path)
+            if stat is None:
+                entry_stat = entry.stat(follow_symlinks=False)
+                stat = (entry_stat.st_size, entry_stat.st_mtime_ns)
+            add_name(entry.name)
+            add_size(stat[0])
+            add_mtime(stat[1])
+    
+    # 모아 둔 항목은 스레드 풀에서 조회 (느리거나 네트워크로 마운트된 녹화 폴더에서 효과가 큼)
+    if pending:
+        chunks = [pending[i:i + STAT_CHUNK] for i in range(0, len(pending), STAT_CHUNK)]
+        for chunk, stats in zip(chunks, _STAT_POOL.map(_stat_entries, chunks)):
+            for entry, stat in zip(chunk, stats):
+                add_name(entry.name)
+                add_size(stat[0])
+                add_mtime(stat[1])
+    
+    # 최신 파일부터 limit개만 선택 (전체 정렬 대신 크기 limit의 힙, 정수 비교)
+    order = heapq.nlargest(limit, range(len(names)), key=mtimes.__getitem__)
+    
+    # 파일명은 HTML에 그대로 들어가므로 선택된 항목만 한 번 이스케이프
+    return [(str(escape(names[i])), sizes[i], mtimes[i]) for i in order], len(names)
+
+
+def _render_files(files: List[Tuple[str, int, int]], total: int) -> Iterator[bytes]:
+    """파일 목록 페이지를 UTF-8 조각 단위로 생성"""
+    yield _FILES_HEAD_B
+    
+    # 오래된 파일이 빠졌다면 개수를 알리고, 상한 안에서 전부 볼 수 있는 링크 제공
+    if total > len(files):
+        more = _FILES_MORE_LINK.format(min(total, MAX_FILES_LIMIT)) if len(files) < MAX_FILES_LIMIT else ''
+        yield _FILES_TRUNCATED.format(len(files), total, more).encode('utf-8')
+    
+    # 행마다 모듈 속성을 찾지 않도록 지역 변수로 바인딩
+    _lt = time.localtime
+    _sf = time.strftime
+    row_format = _FILES_ROW.format
+    for name, size, mtime_ns in files:
+        mtime_str = _sf('%Y-%m-%d %H:%M:%S', _lt(mtime_ns // 1_000_000_000))
+        yield row_format(name, size / (1024 * 1024), mtime_str).encode('utf-8')
+    
+    yield _FILES_TAIL_B
+
+
+@app.route('/files')
+def view_files():
+    """녹화 파일 목록 (행 단위로 스트리밍하면서 캐시 채움, ?limit=N 이면 최근 N개)"""
+    limit = min(MAX_FILES_LIMIT, max(1, request.args.get('limit', MAX_FILES, type=int)))
+    
+    try:
+        rec = get_recorder()
+        key = (_files_cache_key(rec), limit)
+        cached = _FILES_CACHE['entry']
+        if cached is not None and cached[0] == key:
+            return Response(cached[1], mimetype='text/html')
+        
+        files, total = _scan_recordings(rec.record_dir, limit)
+        
+        def generate():
+            # 보낸 조각을 모아 두었다가 끝까지 보냈을 때만 캐시에 저장
+            body = bytearray()
+            for part in _render_files(files, total):
+                body += part
+                yield part
+            _FILES_CACHE['entry'] = (key, bytes(body))
         
-        html += '</body></html>'
-        return html
+        return Response(stream_with_context(generate()), mimetype='text/html')
         
     except Exception as e:
         return f'<p>파일 목록을 불러오는 중 오류가 발생했습니다: {e}</p>'
 
 
+# 웹 서버 시작 배너
+_BANNER = '\n'.join([
+    "=" * 60,
+    "�� 치지직 자동 녹화기 웹 인터페이스",
+    "=" * 60,
+    "📡 웹 서버가 시작되었습니다.",
+    "🌍 접속 주소: http://localhost:5000",
+    "�� 녹화 디렉토리: {record_dir}",
+    "📋 로그 파일: chzzk_recorder.log",
+    "=" * 60,
+    "�� 사용법:",
+    "1. 웹 브라우저에서 http://localhost:5000 접속",
+    "2. '모니터링 시작' 버튼으로 자동 녹화 시작",
+    "3. '녹화 중지' 버튼으로 현재 녹화 중지",
+    "4. '로그 보기'로 상세 로그 확인",
+    "5. '녹화 파일'로 저장된 파일 목록 확인",
+    "=" * 60,
+]) + '\n'
+
+
+def _port_available(host: str, port: int) -> bool:
+    """포트를 바인드할 수 있는지 직접 열어 보고 바로 닫음 (다른 프로그램이 쓰고 있으면 False)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # 서버(Werkzeug)와 같이 SO_REUSEADDR를 켜서 TIME_WAIT 연결은 사용 중으로 보지 않음
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def _web_signal_handler(signum, frame):
+    """웹 모드 종료 신호 처리 (녹화기가 있으면 녹화 정리 후 종료)"""
+    if recorder:
+        recorder._signal_handler(signum, frame)
+    sys.exit(0)
+
+
 def start_web_server():
     """웹 서버 시작"""
-    global recorder
+    load_dotenv()
     
     # HTML 템플릿 생성
     create_templates()
     
-    # 기본 녹화기 초기화
-    recorder = ChzzkRecorder()
-    
-    print("=" * 60)
-    print("�� 치지직 자동 녹화기 웹 인터페이스")
-    print("=" * 60)
-    print(f"📡 웹 서버가 시작되었습니다.")
-    print(f"🌍 접속 주소: http://localhost:5000")
-    print(f"�� 녹화 디렉토리: {recorder.record_dir}")
-    print(f"📋 로그 파일: chzzk_recorder.log")
-    print("=" * 60)
-    print("�� 사용법:")
-    print("1. 웹 브라우저에서 http://localhost:5000 접속")
-    print("2. '모니터링 시작' 버튼으로 자동 녹화 시작")
-    print("3. '녹화 중지' 버튼으로 현재 녹화 중지")
-    print("4. '로그 보기'로 상세 로그 확인")
-    print("5. '녹화 파일'로 저장된 파일 목록 확인")
-    print("=" * 60)
+    # 녹화기 로그를 웹 클라이언트로 실시간 전달
+    _ring_handler.listener = push_log
+    
+    # 녹화기는 첫 요청에서 생성되므로 (요청 스레드에서는 등록 불가) 시그널 핸들러는 여기서 등록
+    signal.signal(signal.SIGINT, _web_signal_handler)
+    signal.signal(signal.SIGTERM, _web_signal_handler)
+    
+    # 포트를 이미 다른 프로그램이 쓰고 있으면 배너 없이 바로 종료
+    if not _port_available('0.0.0.0', 5000):
+        print("❌ 5000번 포트를 이미 다른 프로그램이 사용 중입니다.")
+        sys.exit(1)
+    
+    # 배너는 한 번에 출력
+    sys.stdout.write(_BANNER.format(record_dir=os.getenv('RECORD_DIR', './recordings')))
+    sys.stdout.flush()
     
     # Flask 서버 시작
     socketio.run(app, host='0.0.0.0', port=5000, debug=False)